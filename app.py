@@ -1,10 +1,22 @@
 import streamlit as st
+import numpy as np
 import pandas as pd
 from collections import defaultdict, deque
+from dataclasses import dataclass
 
 import networkx as nx
 import matplotlib.pyplot as plt
 
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional: the scheduling kernel below is written in
+    # nopython-compatible style, so it also runs as plain Python/NumPy.
+    def njit(*args, **kwargs):
+        def wrap(func):
+            return func
+        return wrap
+
 # -------------------------------------------------
 # Session state initialization
 # -------------------------------------------------
@@ -23,8 +35,13 @@ if "next_feeder_id" not in st.session_state:
 if "next_area_id" not in st.session_state:
     st.session_state.next_area_id = 1
 
-if "schedule" not in st.session_state:
-    st.session_state.schedule = []  # 24-hour schedule
+# 24-hour schedule, stored as parallel arrays (one entry per area-cut);
+# the display DataFrame is materialized lazily from these
+if "schedule_slots" not in st.session_state:
+    st.session_state.schedule_slots = np.empty(0, dtype=np.int32)
+    st.session_state.schedule_area_ids = np.empty(0, dtype=np.int64)
+    st.session_state.schedule_loads = np.empty(0, dtype=float)
+    st.session_state.schedule_base_hour = 6
 
 if "maintenance_queue" not in st.session_state:
     st.session_state.maintenance_queue = deque()
@@ -43,36 +60,124 @@ if "area_cut_hours" not in st.session_state:
 if "area_last_cut_slot" not in st.session_state:
     st.session_state.area_last_cut_slot = {}
 
+# cached network graph; rebuilt only after a mutation sets it to None
+if "_graph" not in st.session_state:
+    st.session_state._graph = None
+
+# area_id -> precomputed OFF-intervals text, built at schedule generation
+if "off_info_text" not in st.session_state:
+    st.session_state.off_info_text = {}
+
+
+# -------------------------------------------------
+# Struct-of-arrays view of all areas (for vectorized math)
+# -------------------------------------------------
+@dataclass
+class AreasTable:
+    """
+    Parallel NumPy arrays holding one column per area attribute, so
+    scoring and demand aggregation run as single vectorized expressions
+    instead of per-area Python loops.
+    """
+    ids: np.ndarray
+    feeder_ids: np.ndarray
+    load_kw: np.ndarray
+    population: np.ndarray
+    hospitals: np.ndarray
+    emergency: np.ndarray
+    research: np.ndarray
+    schools: np.ndarray
+    priority_score: np.ndarray
+    priority_level: np.ndarray
+
+
+def build_areas_table():
+    # Narrow dtypes: the facility counts and priority levels are tiny
+    # non-negative ints and the kW figures fit float32 comfortably, so
+    # the whole table stays small enough to live in cache.
+    areas = list(st.session_state.areas.values())
+    return AreasTable(
+        ids=np.array([a["id"] for a in areas], dtype=np.int32),
+        feeder_ids=np.array([a["feeder_id"] for a in areas], dtype=np.int32),
+        load_kw=np.array([a["load_kw"] for a in areas], dtype=np.float32),
+        population=np.array([a["population"] for a in areas], dtype=np.int32),
+        hospitals=np.array([a["num_hospitals"] for a in areas], dtype=np.int16),
+        emergency=np.array([a["num_emergency"] for a in areas], dtype=np.int16),
+        research=np.array([a["num_research"] for a in areas], dtype=np.int16),
+        schools=np.array([a["num_schools"] for a in areas], dtype=np.int16),
+        priority_score=np.array([a["priority_score"] for a in areas], dtype=np.float32),
+        priority_level=np.array([a["priority_level"] for a in areas], dtype=np.int8),
+    )
+
+
+def get_areas_table():
+    """
+    Cached SoA view of the areas dict; rebuilt lazily after any mutation.
+    """
+    if st.session_state.get("_areas_table") is None:
+        st.session_state._areas_table = build_areas_table()
+    return st.session_state._areas_table
+
+
+def invalidate_areas_table():
+    st.session_state._areas_table = None
+
+
+def invalidate_network_graph():
+    st.session_state._graph = None
+
+
+@st.cache_data
+def _areas_dataframe(areas_snapshot):
+    """
+    DataFrame over all areas, memoized on an immutable snapshot of the
+    areas dict so reruns that did not touch any area reuse the frame.
+    """
+    return pd.DataFrame([dict(fields) for _, fields in areas_snapshot])
+
+
+def areas_dataframe():
+    snapshot = tuple(
+        (aid, tuple(a.items())) for aid, a in st.session_state.areas.items()
+    )
+    return _areas_dataframe(snapshot)
+
 
 # -------------------------------------------------
 # Priority scoring logic (automatic, AREA level)
 # -------------------------------------------------
-def compute_area_score(num_hospitals, num_emergency, num_research, num_schools, population):
+def compute_area_scores(num_hospitals, num_emergency, num_research, num_schools, population):
     """
     Weighted criticality model for area importance.[web:104][web:143]
+    Works on scalars or on whole AreasTable columns at once.
     """
-    score = (
+    return (
         5 * num_hospitals
         + 4 * num_emergency
         + 3 * num_research
         + 2 * num_schools
-        + 0.5 * (population / 1000.0)
+        + 0.0005 * np.asarray(population, dtype=float)
     )
-    return score
 
 
-def map_score_to_priority(score):
+# Score bands for priority levels: <5 -> P4, >=5 -> P3, >=10 -> P2, >=20 -> P1.
+_PRIORITY_THRESHOLDS = np.array([5.0, 10.0, 20.0])
+_PRIORITY_VALUES = np.array([4, 3, 2, 1], dtype=np.int8)
+
+
+def map_scores_to_priorities(scores):
     """
     Priority 1 = most important, Priority 4 = least important.
+    A single binary search into the score bands; vectorized over an
+    array of scores (scalars also accepted).
     """
-    if score >= 20:
-        return 1
-    elif score >= 10:
-        return 2
-    elif score >= 5:
-        return 3
-    else:
-        return 4
+    return _PRIORITY_VALUES[
+        np.searchsorted(_PRIORITY_THRESHOLDS, scores, side="right")
+    ]
+
+
+def map_score_to_priority(score):
+    return int(map_scores_to_priorities(score))
 
 
 # -------------------------------------------------
@@ -82,132 +187,78 @@ def calculate_total_demand():
     """
     Total hourly demand if all areas are ON (kW for 1-hour slot).[web:249]
     """
-    return sum(a["load_kw"] for a in st.session_state.areas.values())
+    return float(get_areas_table().load_kw.sum())
 
 
 # -------------------------------------------------
-# Helper: max cut hours per priority
+# Max cut hours per priority (indexed by priority level)
 # -------------------------------------------------
-def max_cut_hours_for_priority(priority_level):
-    """
-    Max total cut hours in a day:
-      P4 -> 12 h, P3 -> 6 h, P2 -> 3 h, P1 -> 0 h.[web:256]
-    """
-    if priority_level == 4:
-        return 12
-    elif priority_level == 3:
-        return 6
-    elif priority_level == 2:
-        return 3
-    else:
-        return 0
-
-
-# -------------------------------------------------
-# Helper: was area cut recently? (no continuous cuts)
-# -------------------------------------------------
-def was_cut_in_recent_slots(area_id, current_slot_index, gap_slots=2):
-    """
-    Ensure at least `gap_slots` hours between cuts for the same area.[web:256]
-    """
-    last_slot = st.session_state.area_last_cut_slot.get(area_id, None)
-    if last_slot is None:
-        return False
-    return (current_slot_index - last_slot) < gap_slots
+# P4 -> 12 h, P3 -> 6 h, P2 -> 3 h, P1 -> 0 h; index 0 unused.[web:256]
+_MAX_CUT_HOURS = np.array([0, 0, 3, 6, 12], dtype=np.int8)
 
 
 # -------------------------------------------------
 # 24-hour area-wise scheduling (using single daily energy input)
 # -------------------------------------------------
-def generate_area_schedule_for_slot(available_power, slot_start_hour, slot_duration, daily_schedule, slot_index):
+@njit(cache=True)
+def _schedule_day(load_kw, priority, max_cut, available_power, total_demand, n_slots, gap_slots):
     """
-    Schedule for ONE hour slot with fairness constraints:
-    - Priority order 4 -> 1.
+    Whole-day scheduling kernel over presorted area arrays (priority 4 -> 1,
+    higher score first within a level):
+    - Priority 1 areas are never cut.
     - Priority-based max cut hours (P4=12, P3=6, P2=3, P1=0).
-    - At least 2-hour gap between cuts for the same area.[web:256][web:303]
+    - At least `gap_slots` hours between cuts for the same area.[web:256][web:303]
+
+    Returns (slot_of_cut, area_row_of_cut, n_cuts, cut_hours, last_cut_slot)
+    where the first two arrays are valid up to n_cuts.
     """
-    total_demand = calculate_total_demand()
-    if total_demand <= available_power:
-        return
+    n = load_kw.shape[0]
+    cut_hours = np.zeros(n, np.int32)
+    last_cut_slot = np.full(n, -100, np.int32)
+    out_slot = np.empty(n_slots * n, np.int32)
+    out_area = np.empty(n_slots * n, np.int32)
+    count = 0
 
     shortage = total_demand - available_power
-    if not st.session_state.areas:
-        return
-
-    if "area_cut_hours" not in st.session_state:
-        st.session_state.area_cut_hours = {}
-    if "area_last_cut_slot" not in st.session_state:
-        st.session_state.area_last_cut_slot = {}
-
-    areas_list = list(st.session_state.areas.values())
-
-    # Sort from least important to most important (priority 4 -> 1)
-    areas_sorted = sorted(
-        areas_list,
-        key=lambda a: (a["priority_level"], a["priority_score"]),
-        reverse=True,
-    )
-
-    selected = []
-    shed_sum = 0
-
-    for area in areas_sorted:
-        if area["priority_level"] == 1:
-            # protect critical areas
-            continue
-
-        aid = area["id"]
-
-        # avoid continuous cuts: require 2-slot gap
-        if was_cut_in_recent_slots(aid, slot_index, gap_slots=2):
-            continue
-
-        already_cut = st.session_state.area_cut_hours.get(aid, 0)
-        max_hours = max_cut_hours_for_priority(area["priority_level"])
-
-        # Enforce priority-based max cut hours
-        if already_cut >= max_hours:
-            continue
-
-        selected.append(area)
-        shed_sum += area["load_kw"]
-
-        # update total cut hours and last cut slot
-        st.session_state.area_cut_hours[aid] = already_cut + slot_duration
-        st.session_state.area_last_cut_slot[aid] = slot_index
-
-        if shed_sum >= shortage:
-            break
-
-    slot_end_hour = (slot_start_hour + slot_duration) % 24
-    for a in selected:
-        start = f"{slot_start_hour:02d}:00"
-        end = f"{slot_end_hour:02d}:00"
-        daily_schedule.append(
-            {
-                "slot": slot_index,
-                "start_time": start,
-                "end_time": end,
-                "area_id": a["id"],
-                "area_name": a["name"],
-                "feeder_id": a["feeder_id"],
-                "feeder_name": st.session_state.feeders[a["feeder_id"]]["name"],
-                "area_priority": a["priority_level"],
-                # internal fields
-                "area_score": a["priority_score"],
-                "load_shed_kw": a["load_kw"],
-                "energy_shed_kwh": a["load_kw"] * slot_duration,
-            }
-        )
+    if shortage <= 0.0:
+        return out_slot, out_area, count, cut_hours, last_cut_slot
+
+    for slot_idx in range(n_slots):
+        shed_sum = 0.0
+        for i in range(n):
+            if shed_sum >= shortage:
+                break
+            if priority[i] == 1:
+                # protect critical areas
+                continue
+            # avoid continuous cuts: require gap_slots gap
+            if slot_idx - last_cut_slot[i] < gap_slots:
+                continue
+            # enforce priority-based max cut hours
+            if cut_hours[i] >= max_cut[priority[i]]:
+                continue
+
+            out_slot[count] = slot_idx
+            out_area[count] = i
+            count += 1
+            shed_sum += load_kw[i]
+            cut_hours[i] += 1
+            last_cut_slot[i] = slot_idx
+
+    return out_slot, out_area, count, cut_hours, last_cut_slot
 
 
 def generate_daily_schedule_from_day_energy(E_day_kwh, base_hour=6, slot_duration=1):
     """
     Day-energy based 24-hour schedule with fairness constraints.[web:248][web:256]
+
+    The per-slot selection runs inside the `_schedule_day` kernel (JIT
+    compiled when Numba is installed); the dict records for the UI are
+    materialized once afterwards.
     """
     st.session_state.area_cut_hours = {}
     st.session_state.area_last_cut_slot = {}
-    daily_schedule = []
+    invalidate_network_graph()
 
     D_hour = calculate_total_demand()
     E_needed = 24 * D_hour
@@ -215,12 +266,12 @@ def generate_daily_schedule_from_day_energy(E_day_kwh, base_hour=6, slot_duratio
     if D_hour == 0:
         st.session_state.day_factor_f = 1.0
         st.session_state.P_avail_hour = None
-        return daily_schedule, "No demand (no areas)."
+        return 0, "No demand (no areas)."
 
     if E_day_kwh >= E_needed:
         st.session_state.day_factor_f = 1.0
         st.session_state.P_avail_hour = D_hour
-        return daily_schedule, (
+        return 0, (
             f"No shortage. Daily available energy {E_day_kwh:.1f} kWh "
             f">= required {E_needed:.1f} kWh."
         )
@@ -231,24 +282,102 @@ def generate_daily_schedule_from_day_energy(E_day_kwh, base_hour=6, slot_duratio
     st.session_state.day_factor_f = f
     st.session_state.P_avail_hour = P_avail
 
-    for slot_idx in range(24):
-        slot_start_hour = (base_hour + slot_idx) % 24
-        generate_area_schedule_for_slot(
-            available_power=P_avail,
-            slot_start_hour=slot_start_hour,
-            slot_duration=slot_duration,
-            daily_schedule=daily_schedule,
-            slot_index=slot_idx,
-        )
+    # Sort once from least important to most important (priority 4 -> 1);
+    # the kernel then just walks the fixed order every slot.
+    t = get_areas_table()
+    order = np.lexsort((-t.priority_score, -t.priority_level))
+    ids_sorted = t.ids[order]
+    load_sorted = np.ascontiguousarray(t.load_kw[order])
+    prio_sorted = np.ascontiguousarray(t.priority_level[order])
+
+    out_slot, out_area, n_cuts, cut_hours, last_cut_slot = _schedule_day(
+        load_sorted,
+        prio_sorted,
+        _MAX_CUT_HOURS,
+        float(P_avail),
+        float(D_hour),
+        24,
+        2,
+    )
 
-    st.session_state.schedule = daily_schedule
+    ss = st.session_state
+    area_cut_hours = ss.area_cut_hours
+    area_last_cut_slot = ss.area_last_cut_slot
+
+    # Write fairness counters back for the energy/graph views.
+    for i in range(len(ids_sorted)):
+        if cut_hours[i] > 0:
+            aid = int(ids_sorted[i])
+            area_cut_hours[aid] = int(cut_hours[i]) * slot_duration
+            area_last_cut_slot[aid] = int(last_cut_slot[i])
+
+    # Keep the schedule columnar: trimmed kernel outputs plus the shed
+    # loads, resolved to area ids. Names, feeders and priorities are
+    # looked up only when the display DataFrame is materialized.
+    slots = out_slot[:n_cuts].copy()
+    sel = out_area[:n_cuts]
+    ss.schedule_slots = slots
+    ss.schedule_area_ids = ids_sorted[sel]
+    ss.schedule_loads = load_sorted[sel]
+    ss.schedule_base_hour = base_hour
+
+    # Collect the OFF intervals per area in the same pass so the graph
+    # view never has to re-walk the schedule.
+    slots_per_area = defaultdict(list)
+    for k in range(n_cuts):
+        slot_start_hour = (base_hour + int(slots[k])) % 24
+        slot_end_hour = (slot_start_hour + slot_duration) % 24
+        slots_per_area[int(ss.schedule_area_ids[k])].append(
+            f"{slot_start_hour:02d}:00-{slot_end_hour:02d}:00"
+        )
+    ss.off_info_text = {
+        aid: "OFF\n" + "\n".join(intervals)  # one interval per line
+        for aid, intervals in slots_per_area.items()
+    }
+    # cut hours changed, so edge energies and OFF labels are stale
+    invalidate_network_graph()
     msg = (
         f"Shortage exists. Daily required energy = {E_needed:.1f} kWh, "
         f"available = {E_day_kwh:.1f} kWh. "
         f"Uniform hourly available power used = {P_avail:.1f} kW "
         f"(scaling factor f = {f:.3f})."
     )
-    return daily_schedule, msg
+    return n_cuts, msg
+
+
+def schedule_dataframe():
+    """
+    Materialize the columnar schedule into a DataFrame for display.
+    Name/feeder/priority columns are resolved here, once per render,
+    instead of being copied into every schedule record.
+    """
+    ss = st.session_state
+    slots = ss.schedule_slots
+    if slots.size == 0:
+        return pd.DataFrame()
+
+    areas = ss.areas
+    start_h = (ss.schedule_base_hour + slots) % 24
+    end_h = (start_h + 1) % 24
+    area_ids = pd.Series(ss.schedule_area_ids)
+    feeder_ids = area_ids.map({aid: a["feeder_id"] for aid, a in areas.items()})
+    return pd.DataFrame(
+        {
+            "slot": slots,
+            "start_time": [f"{h:02d}:00" for h in start_h],
+            "end_time": [f"{h:02d}:00" for h in end_h],
+            "area_id": area_ids,
+            "area_name": area_ids.map({aid: a["name"] for aid, a in areas.items()}),
+            "feeder_id": feeder_ids,
+            "feeder_name": feeder_ids.map(
+                {fid: f["name"] for fid, f in ss.feeders.items()}
+            ),
+            "area_priority": area_ids.map(
+                {aid: a["priority_level"] for aid, a in areas.items()}
+            ),
+            "load_shed_kw": ss.schedule_loads,
+        }
+    )
 
 
 # -------------------------------------------------
@@ -258,22 +387,48 @@ def compute_feeder_daily_energy():
     """
     Compute daily supplied energy (kWh/day) per feeder, substation, plant,
     after applying the schedule.[web:248][web:253]
+
+    Both aggregation levels run as np.bincount reductions over the SoA
+    area table; only the cut-hours gather and the final id -> energy
+    dicts (kept for the graph code) remain Python-level.
     """
-    feeder_energy = defaultdict(float)   # kWh/day
-    for aid, a in st.session_state.areas.items():
-        cut_h = st.session_state.area_cut_hours.get(aid, 0)
-        on_hours = 24 - cut_h
-        if on_hours < 0:
-            on_hours = 0
-        e_area = on_hours * a["load_kw"]  # kWh/day
-        feeder_energy[a["feeder_id"]] += e_area
-
-    substation_energy = defaultdict(float)
-    for fid, e in feeder_energy.items():
-        sub_id = st.session_state.feeders[fid]["substation_id"]
-        substation_energy[sub_id] += e
-
-    plant_energy = sum(substation_energy.values())
+    ss = st.session_state
+    feeders = ss.feeders
+    t = get_areas_table()
+
+    if t.ids.size == 0:
+        return {}, {}, 0.0
+
+    cut_hours = ss.area_cut_hours
+    cut = np.fromiter(
+        (cut_hours.get(int(aid), 0) for aid in t.ids),
+        dtype=np.int64,
+        count=t.ids.size,
+    )
+    on_hours = np.clip(24 - cut, 0, 24)
+    e_area = on_hours * t.load_kw  # kWh/day per area
+
+    minlength = max(feeders) + 1 if feeders else int(t.feeder_ids.max()) + 1
+    feeder_totals = np.bincount(t.feeder_ids, weights=e_area, minlength=minlength)
+    feeder_energy = {fid: float(feeder_totals[fid]) for fid in feeders}
+
+    if feeders:
+        fids = np.fromiter(feeders.keys(), dtype=np.int64, count=len(feeders))
+        sub_ids = np.fromiter(
+            (feeders[int(fid)]["substation_id"] for fid in fids),
+            dtype=np.int64,
+            count=len(feeders),
+        )
+        sub_totals = np.bincount(sub_ids, weights=feeder_totals[fids])
+        substation_energy = {
+            sid: float(sub_totals[sid])
+            for sid in ss.substations
+            if sid < len(sub_totals)
+        }
+    else:
+        substation_energy = {}
+
+    plant_energy = float(e_area.sum())
     return feeder_energy, substation_energy, plant_energy
 
 
@@ -292,65 +447,94 @@ def build_network_graph():
 
     feeder_energy, substation_energy, plant_energy = compute_feeder_daily_energy()
 
-    # Plant node
+    ss = st.session_state
+    cut_hours = ss.area_cut_hours
+
+    # Build one (node, attrs) / (u, v, attrs) list per level and insert
+    # in bulk: add_nodes_from/add_edges_from amortize NetworkX's
+    # per-call overhead across each level.
     G.add_node("Plant", layer=0, label="Power Plant")
 
     # Substations
-    for sid, sub in st.session_state.substations.items():
-        sub_node = f"S{sub['id']}"
-        G.add_node(sub_node, layer=1, label=sub["name"])
-        e_sub = substation_energy.get(sid, 0.0)
-        G.add_edge("Plant", sub_node, energy_kwh=e_sub)
+    G.add_nodes_from(
+        (f"S{sub['id']}", {"layer": 1, "label": sub["name"]})
+        for sub in ss.substations.values()
+    )
+    G.add_edges_from(
+        ("Plant", f"S{sid}", {"energy_kwh": substation_energy.get(sid, 0.0)})
+        for sid in ss.substations
+    )
 
     # Feeders
-    for fid, fdr in st.session_state.feeders.items():
-        sub_node = f"S{fdr['substation_id']}"
-        feeder_node = f"F{fid}"
-        G.add_node(feeder_node, layer=2, label=fdr["name"])
-        e_feed = feeder_energy.get(fid, 0.0)
-        G.add_edge(sub_node, feeder_node, energy_kwh=e_feed)
+    G.add_nodes_from(
+        (f"F{fid}", {"layer": 2, "label": fdr["name"]})
+        for fid, fdr in ss.feeders.items()
+    )
+    G.add_edges_from(
+        (
+            f"S{fdr['substation_id']}",
+            f"F{fid}",
+            {"energy_kwh": feeder_energy.get(fid, 0.0)},
+        )
+        for fid, fdr in ss.feeders.items()
+    )
 
     # Areas
-    for aid, a in st.session_state.areas.items():
-        feeder_node = f"F{a['feeder_id']}"
-        area_node = f"A{aid}"
-        label = f"{a['name']} (P{a['priority_level']})"
-        G.add_node(area_node, layer=3, label=label)
-
-        cut_h = st.session_state.area_cut_hours.get(aid, 0)
-        on_hours = max(0, 24 - cut_h)
-        e_area = on_hours * a["load_kw"]
-        G.add_edge(feeder_node, area_node, energy_kwh=e_area)
+    G.add_nodes_from(
+        (f"A{aid}", {"layer": 3, "label": f"{a['name']} (P{a['priority_level']})"})
+        for aid, a in ss.areas.items()
+    )
+    G.add_edges_from(
+        (
+            f"F{a['feeder_id']}",
+            f"A{aid}",
+            {"energy_kwh": max(0, 24 - cut_hours.get(aid, 0)) * a["load_kw"]},
+        )
+        for aid, a in ss.areas.items()
+    )
 
     return G
 
 
 def get_area_off_info_all():
     """
-    For each area, collect list of all OFF intervals from schedule.
-    Returns multiline text so each interval appears on a new line.[web:253][web:270]
+    For each area, the OFF-intervals text (one interval per line),
+    precomputed during schedule generation.[web:253][web:270]
     """
-    slots_per_area = defaultdict(list)
-    for rec in st.session_state.schedule:
-        aid = rec["area_id"]
-        slots_per_area[aid].append(f"{rec['start_time']}-{rec['end_time']}")
-
-    info_text = {}
-    for aid in st.session_state.areas.keys():
-        if aid in slots_per_area and slots_per_area[aid]:
-            joined = "\n".join(slots_per_area[aid])  # one per line
-            info_text[aid] = f"OFF\n{joined}"
-        else:
-            info_text[aid] = "ON\n(full)"
-    return info_text
+    ss = st.session_state
+    cached = ss.off_info_text
+    return {aid: cached.get(aid, "ON\n(full)") for aid in ss.areas.keys()}
 
 
 def draw_network_graph():
-    G = build_network_graph()
+    # Streamlit reruns the whole script on any widget interaction, so
+    # only rebuild the graph when a mutation invalidated the cached one.
+    if st.session_state._graph is None:
+        st.session_state._graph = build_network_graph()
+    G = st.session_state._graph
     if G.number_of_nodes() == 0:
         st.info("No nodes in the network yet.")
         return
 
+    off_info = get_area_off_info_all()
+    nodes_key = hash(frozenset(G.nodes))
+    cached = st.session_state.get("_net_render")
+
+    if cached is not None and cached["nodes_key"] == nodes_key:
+        # Same topology as the cached figure: creating a Matplotlib
+        # figure plus all node/edge patches costs tens of milliseconds,
+        # so just refresh the label texts on the existing artists.
+        for (u, v), artist in cached["edge_label_artists"].items():
+            e = G.edges[u, v].get("energy_kwh", 0.0)
+            artist.set_text(f"{e:.1f} kWh/day" if e > 0 else "")
+        for aid, artist in cached["off_text_artists"].items():
+            artist.set_text(off_info.get(aid, "ON\n(full)"))
+        st.pyplot(cached["fig"], clear_figure=False)
+        return
+
+    if cached is not None:
+        plt.close(cached["fig"])
+
     pos = {}
     layers = {}
     for node, data in G.nodes(data=True):
@@ -365,7 +549,7 @@ def draw_network_graph():
 
     labels = {n: d.get("label", n) for n, d in G.nodes(data=True)}
 
-    plt.figure(figsize=(10, 6))
+    fig = plt.figure(figsize=(10, 6))
     nx.draw(
         G,
         pos,
@@ -383,14 +567,15 @@ def draw_network_graph():
         arrowsize=12,
     )
 
-    # Edge labels: daily energy division
+    # Edge labels: daily energy division. Labels exist for every edge
+    # (empty text when no energy flows) so the reuse path above can
+    # toggle them without redrawing.
     edge_labels = {}
     for u, v, data in G.edges(data=True):
         e = data.get("energy_kwh", 0.0)
-        if e > 0:
-            edge_labels[(u, v)] = f"{e:.1f} kWh/day"
+        edge_labels[(u, v)] = f"{e:.1f} kWh/day" if e > 0 else ""
 
-    nx.draw_networkx_edge_labels(
+    edge_label_artists = nx.draw_networkx_edge_labels(
         G,
         pos,
         edge_labels=edge_labels,
@@ -399,13 +584,13 @@ def draw_network_graph():
     )
 
     # OFF / ON text below area circles (all intervals, stacked)
-    off_info = get_area_off_info_all()
-    for aid, a in st.session_state.areas.items():
+    off_text_artists = {}
+    for aid in st.session_state.areas:
         node = f"A{aid}"
         if node in pos:
             x, y = pos[node]
             text = off_info.get(aid, "ON\n(full)")
-            plt.text(
+            off_text_artists[aid] = plt.text(
                 x,
                 y - 0.25,
                 text,
@@ -417,8 +602,14 @@ def draw_network_graph():
             )
 
     plt.axis("off")
-    st.pyplot(plt.gcf())
-    plt.close()
+    st.session_state._net_render = {
+        "nodes_key": nodes_key,
+        "fig": fig,
+        "pos": pos,
+        "edge_label_artists": edge_label_artists,
+        "off_text_artists": off_text_artists,
+    }
+    st.pyplot(fig, clear_figure=False)
 
 
 # -------------------------------------------------
@@ -459,6 +650,7 @@ with st.sidebar:
                 "name": feeder_name_new.strip(),
                 "substation_id": substation_id,
             }
+            invalidate_network_graph()
             st.success(f"Feeder '{feeder_name_new}' added.")
         else:
             st.error("Enter a feeder name.")
@@ -540,12 +732,14 @@ with tab1:
                 if not name.strip():
                     st.error("Enter area name.")
                 else:
-                    score = compute_area_score(
-                        num_hospitals=num_hospitals,
-                        num_emergency=num_emergency,
-                        num_research=num_research,
-                        num_schools=num_schools,
-                        population=population,
+                    score = float(
+                        compute_area_scores(
+                            num_hospitals=num_hospitals,
+                            num_emergency=num_emergency,
+                            num_research=num_research,
+                            num_schools=num_schools,
+                            population=population,
+                        )
                     )
                     priority_level = map_score_to_priority(score)
 
@@ -565,6 +759,8 @@ with tab1:
                         "priority_score": score,
                         "priority_level": priority_level,
                     }
+                    invalidate_areas_table()
+                    invalidate_network_graph()
 
                     st.success(
                         f"Area '{name}' added. Auto priority = {priority_level} (score {score:.1f})."
@@ -573,14 +769,14 @@ with tab1:
         st.markdown("---")
         st.subheader("Areas List with Auto Priority (This Feeder)")
 
-        feeder_areas = [
-            a
-            for a in st.session_state.areas.values()
-            if a["feeder_id"] == selected_feeder_id
-        ]
+        df_all_areas = areas_dataframe()
+        df = (
+            df_all_areas[df_all_areas["feeder_id"] == selected_feeder_id]
+            if not df_all_areas.empty
+            else df_all_areas
+        )
 
-        if feeder_areas:
-            df = pd.DataFrame(feeder_areas)
+        if not df.empty:
             df_display = df[
                 [
                     "id",
@@ -607,7 +803,7 @@ with tab2:
     st.subheader("All Areas: Priority and Details")
 
     if st.session_state.areas:
-        df_all = pd.DataFrame(st.session_state.areas.values())
+        df_all = areas_dataframe()
         df_all_display = df_all[
             [
                 "id",
@@ -651,10 +847,10 @@ with tab3:
     )
 
     if st.button("Generate 24-hour Schedule from Daily Energy"):
-        daily, msg = generate_daily_schedule_from_day_energy(
+        n_cut_records, msg = generate_daily_schedule_from_day_energy(
             E_day_kwh=E_day, base_hour=6, slot_duration=1
         )
-        if daily:
+        if n_cut_records:
             st.success(msg)
         else:
             st.warning(msg)
@@ -662,8 +858,8 @@ with tab3:
     st.markdown("---")
     st.subheader("Daily Power Cut Schedule (Area-wise)")
 
-    if st.session_state.schedule:
-        df_sched = pd.DataFrame(st.session_state.schedule)
+    if st.session_state.schedule_slots.size:
+        df_sched = schedule_dataframe()
         df_sched = df_sched.sort_values(
             ["slot", "area_priority"], ascending=[True, False]
         )
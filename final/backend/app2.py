@@ -1,53 +1,34 @@
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request
 from flask_cors import CORS
 from collections import defaultdict
-from datetime import datetime, timedelta
-import heapq
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from operator import itemgetter
+import bisect
+import functools
+import gzip
+import os
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+import msgspec
+import orjson
 
 app = Flask(__name__)
 CORS(app)
 
-# =====================================================
-# BST IMPLEMENTATION (LOAD SHEDDING)
-# =====================================================
-class TreeNode:
-    def __init__(self, key, area_id):
-        self.key = key
-        self.area_id = area_id
-        self.left = None
-        self.right = None
-
-class AreaBST:
-    def __init__(self):
-        self.root = None
-
-    def insert(self, key, area_id):
-        def _insert(node, key, area_id):
-            if not node:
-                return TreeNode(key, area_id)
-            if key < node.key:
-                node.left = _insert(node.left, key, area_id)
-            else:
-                node.right = _insert(node.right, key, area_id)
-            return node
-        self.root = _insert(self.root, key, area_id)
-
-    def inorder(self):
-        result = []
-        def _inorder(node):
-            if node:
-                _inorder(node.left)
-                result.append(node.area_id)
-                _inorder(node.right)
-        _inorder(self.root)
-        return result
-
-    def rebuild(self, areas):
-        self.root = None
-        for aid, area in areas.items():
-            # LOW PRIORITY FIRST (P4 → P1)
-            key = (-area["priority"], -area["load_kw"], aid)
-            self.insert(key, aid)
+
+def json_response(obj, status=200):
+    """jsonify replacement: orjson serializes at C speed straight to
+    bytes. OPT_NON_STR_KEYS covers the int-keyed feeder/area dicts."""
+    return Response(
+        orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS),
+        status=status,
+        mimetype="application/json",
+    )
 
 # =====================================================
 # APPLICATION STATE
@@ -58,25 +39,141 @@ class AppState:
 
         self.feeders = {}
         self.next_feeder_id = 1
+        # feeder_id → name, mirrored on feeder create/delete so read
+        # endpoints don't rebuild the mapping per request
+        self.feeder_names = {}
 
         self.areas = {}
         self.next_area_id = 1
+        # running sum of area loads, adjusted on every area mutation
+        self.total_demand = 0.0
+
+        # Columnar mirror of the numeric area fields; kept in sync on
+        # every area mutation so read endpoints can aggregate with
+        # pandas groupby instead of Python loops.
+        self.areas_df = pd.DataFrame(columns=["id", "feeder_id", "load_kw"])
+
+        # Reverse index feeder_id -> {area_id}, so deleting a feeder
+        # only touches its own areas.
+        self.feeder_areas = defaultdict(set)
+
+        # Bumped by every feeder/area mutation; ETag for the network
+        # graph endpoint.
+        self.graph_version = 0
 
         # Load shedding
         self.schedule = []
+        # Written rarely, read on every poll: serialize once at write
+        # time and hand every GET the same byte string.
+        self.schedule_bytes = orjson.dumps({"schedule": []})
+        # Bumped on every regeneration; doubles as the ETag so pollers
+        # get a 304 instead of a fresh serialization when unchanged.
+        self.schedule_version = 0
         self.P_avail_hour = 0
-        self.area_cut_hours = {}
-        self.area_last_cut_slot = {}
-        self.area_tree = AreaBST()
-
-        # Maintenance (priority queue – correct)
-        self.maintenance_pq = []          # (priority, timestamp, task_id)
-        self.maintenance_map = {}         # task_id → task
-        self.resolved_tasks = set()
+
+        # Struct-of-arrays view of the numeric area fields used by the
+        # scheduler: area_index maps aid → row in the parallel arrays
+        # below, rows are kept dense by swap-removing on delete, and
+        # the arrays double in capacity as areas are added. Replaces
+        # the old per-field {aid: value} dicts.
+        self.area_index = {}
+        self.soa_count = 0
+        self.soa_ids = np.zeros(16, dtype=np.int64)
+        self.soa_loads = np.zeros(16, dtype=float)
+        self.soa_prios = np.zeros(16, dtype=np.int64)
+        self.soa_cut_hours = np.zeros(16, dtype=np.int64)
+        self.soa_last_cut_slot = np.full(16, -10, dtype=np.int64)
+
+        # Shedding order: area ids sorted LOW PRIORITY FIRST (P4 → P1),
+        # heaviest load first within a priority. Maintained incrementally
+        # (bisect on the parallel key list) on single-area mutations and
+        # rebuilt in one sort on bulk mutations.
+        self.area_order = []
+        self._order_keys = []
+
+        # Maintenance
+        self.maintenance_map = {}         # task_id → task (active tasks only)
         self.next_task_id = 0
 
+        # Schedule generation runs off the request thread; a single
+        # worker also serializes concurrent generate calls that would
+        # otherwise race on the shared counters.
+        self.scheduler_executor = ThreadPoolExecutor(max_workers=1)
+        self.schedule_jobs = {}           # job_id → Future
+        self.next_job_id = 1
+
+        # Serializes mutations when the app runs under a threaded WSGI
+        # server (see wsgi.py); reentrant so locked handlers can call
+        # locked helpers.
+        self.lock = threading.RLock()
+
+    _SOA_FIELDS = ("soa_ids", "soa_loads", "soa_prios",
+                   "soa_cut_hours", "soa_last_cut_slot")
+
+    def soa_append(self, area):
+        row = self.soa_count
+        if row == self.soa_ids.size:
+            for name in self._SOA_FIELDS:
+                old = getattr(self, name)
+                grown = np.zeros(2 * row, dtype=old.dtype)
+                grown[:row] = old
+                setattr(self, name, grown)
+        self.soa_ids[row] = area["id"]
+        self.soa_loads[row] = area["load_kw"]
+        self.soa_prios[row] = area["priority"]
+        self.soa_cut_hours[row] = 0
+        self.soa_last_cut_slot[row] = -10
+        self.area_index[area["id"]] = row
+        self.soa_count += 1
+
+    def soa_remove(self, aid):
+        row = self.area_index.pop(aid, None)
+        if row is None:
+            return
+        last = self.soa_count - 1
+        if row != last:
+            for name in self._SOA_FIELDS:
+                arr = getattr(self, name)
+                arr[row] = arr[last]
+            self.area_index[int(self.soa_ids[row])] = row
+        self.soa_count -= 1
+
+    @staticmethod
+    def _shed_key(area):
+        return (-area["priority"], -area["load_kw"], area["id"])
+
+    def order_insert(self, area):
+        key = self._shed_key(area)
+        i = bisect.bisect_left(self._order_keys, key)
+        self._order_keys.insert(i, key)
+        self.area_order.insert(i, area["id"])
+
+    def order_remove(self, area):
+        key = self._shed_key(area)
+        i = bisect.bisect_left(self._order_keys, key)
+        if i < len(self._order_keys) and self._order_keys[i] == key:
+            del self._order_keys[i]
+            del self.area_order[i]
+
+    def rebuild_order(self):
+        keyed = sorted((self._shed_key(a), aid) for aid, a in self.areas.items())
+        self._order_keys = [key for key, _ in keyed]
+        self.area_order = [aid for _, aid in keyed]
+
+    def ordered_area_ids(self):
+        return self.area_order
+
 app_state = AppState()
 
+
+def locked(handler):
+    """Run a state-mutating handler under the app_state lock."""
+    @functools.wraps(handler)
+    def wrapper(*args, **kwargs):
+        with app_state.lock:
+            return handler(*args, **kwargs)
+    return wrapper
+
 # =====================================================
 # PRIORITY LOGIC
 # =====================================================
@@ -89,47 +186,97 @@ def map_score_to_priority(score):
     if score >= 5: return 3
     return 4
 
-def max_cut_hours_for_priority(priority):
-    return {1: 0, 2: 3, 3: 6, 4: 12}[priority]
+# Per-priority shedding limits, indexed by priority (index 0 unused):
+# P1 is never cut; lower priorities tolerate longer cuts and shorter
+# cooldowns between them.
+_MAX_CUT_BY_PRIORITY = (0, 0, 3, 6, 12)
+_COOLDOWN_BY_PRIORITY = (0, 0, 4, 3, 2)
+
+# Array versions for the vectorized scheduling path.
+_MAX_CUT_ARR = np.array(_MAX_CUT_BY_PRIORITY, dtype=np.int64)
+_COOLDOWN_ARR = np.array(_COOLDOWN_BY_PRIORITY, dtype=np.int64)
+
+# The schedule always runs 06:00 → next-day 06:00 in 1-hour slots, so
+# the (start, end) labels are deterministic — no datetime math needed.
+_HOUR_LABELS = [
+    (f"{(6 + h) % 24:02d}:00", f"{(7 + h) % 24:02d}:00") for h in range(24)
+]
 
 def calculate_total_demand():
-    return sum(a["load_kw"] for a in app_state.areas.values())
+    return app_state.total_demand
+
+# =====================================================
+# REQUEST SCHEMAS
+# =====================================================
+# msgspec decodes request bodies straight from bytes into typed
+# structs in one C-level pass, replacing request.json plus a chain of
+# per-field .get calls; type errors surface as a 400 at the boundary.
+class NewArea(msgspec.Struct):
+    feeder_id: int
+    name: str
+    load_kw: float = 0
+    population: int = 0
+    hospitals: int = 0
+    emergency_services: int = 0
+    research_centers: int = 0
+    schools: int = 0
+
+class NewAreaBatch(msgspec.Struct):
+    areas: list[NewArea] = []
+
+class NewTask(msgspec.Struct):
+    area_id: int
+    issue: str = ""
+
+class GenerateRequest(msgspec.Struct):
+    available_power: float = 0
 
 # =====================================================
 # DASHBOARD
 # =====================================================
 @app.route("/api/dashboard", methods=["GET"])
+@locked
 def dashboard():
     priority_counts = [0, 0, 0, 0]
     for a in app_state.areas.values():
         priority_counts[a["priority"] - 1] += 1
 
-    return jsonify({
+    return json_response({
         "total_demand": calculate_total_demand(),
         "available_power": app_state.P_avail_hour,
         "current_hour": f"{datetime.now().hour:02d}",
         "substations": app_state.substations,
-        "priority_areas": priority_counts
+        "priority_areas": priority_counts,
+        # Everything a dashboard refresh needs, in one round-trip and
+        # one serialization instead of four separate GETs.
+        "areas": _areas_payload(),
+        "schedule": app_state.schedule,
+        "maintenance": {"queue": _maintenance_queue()},
+        "graph": _graph_payload()
     })
 
 # =====================================================
 # FEEDERS
 # =====================================================
 @app.route("/api/feeders", methods=["GET", "POST", "OPTIONS"])
+@locked
 def feeders_handler():
     if request.method == "OPTIONS":
         return "", 200
 
     if request.method == "GET":
-        load_pf = defaultdict(float)
-        areas_pf = defaultdict(int)
-        for a in app_state.areas.values():
-            load_pf[a["feeder_id"]] += a["load_kw"]
-            areas_pf[a["feeder_id"]] += 1
-        return jsonify({
+        if app_state.areas_df.empty:
+            load_pf, areas_pf = {}, {}
+        else:
+            agg = app_state.areas_df.groupby("feeder_id").agg(
+                load=("load_kw", "sum"), count=("id", "size")
+            )
+            load_pf = {int(k): float(v) for k, v in agg["load"].items()}
+            areas_pf = {int(k): int(v) for k, v in agg["count"].items()}
+        return json_response({
             "feeders": app_state.feeders,
-            "load_per_feeder": dict(load_pf),
-            "areas_per_feeder": dict(areas_pf)
+            "load_per_feeder": load_pf,
+            "areas_per_feeder": areas_pf
         })
 
     data = request.json
@@ -141,215 +288,430 @@ def feeders_handler():
         "name": data["name"],
         "capacity_kw": data.get("capacity_kw", 1000)
     }
-    return jsonify({"success": True, "feeder_id": fid})
+    app_state.feeder_names[fid] = data["name"]
+    app_state.graph_version += 1
+    return json_response({"success": True, "feeder_id": fid})
 
 @app.route("/api/feeders/<int:fid>", methods=["DELETE"])
+@locked
 def delete_feeder(fid):
     if fid not in app_state.feeders:
-        return jsonify({"error": "Feeder not found"}), 404
+        return json_response({"error": "Feeder not found"}), 404
 
     del app_state.feeders[fid]
-    app_state.areas = {k:v for k,v in app_state.areas.items() if v["feeder_id"] != fid}
-    app_state.area_tree.rebuild(app_state.areas)
-    return jsonify({"success": True})
+    app_state.feeder_names.pop(fid, None)
+    for aid in app_state.feeder_areas.pop(fid, ()):
+        area = app_state.areas.pop(aid)
+        app_state.total_demand -= area["load_kw"]
+        app_state.order_remove(area)
+        app_state.soa_remove(aid)
+    app_state.areas_df = app_state.areas_df[app_state.areas_df["feeder_id"] != fid]
+    app_state.graph_version += 1
+    return json_response({"success": True})
 
 # =====================================================
 # AREAS
 # =====================================================
+def _build_area(aid, data):
+    """Score one decoded NewArea and return its area record; no state
+    writes, so batch inserts can build all records before touching the
+    dicts."""
+    score = compute_area_score(
+        data.hospitals,
+        data.emergency_services,
+        data.research_centers,
+        data.schools,
+        data.population
+    )
+
+    return {
+        "id": aid,
+        "feeder_id": data.feeder_id,
+        "name": data.name,
+        "load_kw": data.load_kw,
+        "population": data.population,
+        "priority": map_score_to_priority(score),
+        "priority_score": score
+    }
+
+
+def _register_area(area):
+    """Hook a built record into the secondary structures. The caller is
+    responsible for invalidating the shed order and extending areas_df,
+    so batch inserts pay those costs once."""
+    app_state.soa_append(area)
+    app_state.feeder_areas[area["feeder_id"]].add(area["id"])
+    app_state.total_demand += area["load_kw"]
+
+
+def _extend_areas_df(aids):
+    app_state.areas_df = pd.concat(
+        [
+            app_state.areas_df,
+            pd.DataFrame(
+                [
+                    {
+                        "id": aid,
+                        "feeder_id": app_state.areas[aid]["feeder_id"],
+                        "load_kw": app_state.areas[aid]["load_kw"],
+                    }
+                    for aid in aids
+                ]
+            ),
+        ],
+        ignore_index=True,
+    )
+
+
+def _areas_payload():
+    return {
+        "areas": app_state.areas,
+        "feeder_names": app_state.feeder_names
+    }
+
+
 @app.route("/api/areas", methods=["GET", "POST", "OPTIONS"])
+@locked
 def areas_handler():
     if request.method == "OPTIONS":
         return "", 200
 
     if request.method == "GET":
-        feeder_names = {k:v["name"] for k,v in app_state.feeders.items()}
-        return jsonify({"areas": app_state.areas, "feeder_names": feeder_names})
+        return json_response(_areas_payload())
 
-    data = request.json
-    score = compute_area_score(
-        data.get("hospitals",0),
-        data.get("emergency_services",0),
-        data.get("research_centers",0),
-        data.get("schools",0),
-        data.get("population",0)
-    )
+    try:
+        payload = msgspec.json.decode(request.get_data(), type=NewArea)
+    except msgspec.DecodeError as exc:
+        return json_response({"error": str(exc)}), 400
 
     aid = app_state.next_area_id
     app_state.next_area_id += 1
+    area = _build_area(aid, payload)
+    app_state.areas[aid] = area
+    _register_area(area)
+    app_state.order_insert(area)
+    _extend_areas_df([aid])
+    app_state.graph_version += 1
 
-    app_state.areas[aid] = {
-        "id": aid,
-        "feeder_id": int(data["feeder_id"]),
-        "name": data["name"],
-        "load_kw": data.get("load_kw",0),
-        "population": data.get("population",0),
-        "priority": map_score_to_priority(score),
-        "priority_score": score
-    }
+    return json_response({"success": True, "area_id": aid})
 
-    app_state.area_cut_hours[aid] = 0
-    app_state.area_last_cut_slot[aid] = -10
-    app_state.area_tree.rebuild(app_state.areas)
 
-    return jsonify({"success": True, "area_id": aid})
+@app.route("/api/areas/batch", methods=["POST", "DELETE", "OPTIONS"])
+@locked
+def areas_batch_handler():
+    if request.method == "OPTIONS":
+        return "", 200
+
+    if request.method == "POST":
+        try:
+            payloads = msgspec.json.decode(
+                request.get_data(), type=NewAreaBatch
+            ).areas
+        except msgspec.DecodeError as exc:
+            return json_response({"error": str(exc)}), 400
+        new_ids = list(range(
+            app_state.next_area_id, app_state.next_area_id + len(payloads)
+        ))
+        app_state.next_area_id += len(payloads)
+        records = [_build_area(aid, data) for aid, data in zip(new_ids, payloads)]
+        # One sized insert via the dict-from-iterable fast path instead
+        # of growing (and rehashing) the store entry by entry.
+        app_state.areas.update(zip(new_ids, records))
+        for area in records:
+            _register_area(area)
+        app_state.rebuild_order()
+        if new_ids:
+            _extend_areas_df(new_ids)
+            app_state.graph_version += 1
+        return json_response({"success": True, "area_ids": new_ids})
+
+    # DELETE: remove a list of area ids in one round-trip
+    removed = []
+    for aid in request.json.get("area_ids", []):
+        area = app_state.areas.pop(int(aid), None)
+        if area is None:
+            continue
+        app_state.feeder_areas[area["feeder_id"]].discard(area["id"])
+        app_state.total_demand -= area["load_kw"]
+        app_state.soa_remove(area["id"])
+        removed.append(area["id"])
+    app_state.rebuild_order()
+    if removed:
+        app_state.areas_df = app_state.areas_df[
+            ~app_state.areas_df["id"].isin(removed)
+        ]
+        app_state.graph_version += 1
+    return json_response({"success": True, "deleted": removed})
 
 @app.route("/api/areas/<int:aid>", methods=["DELETE"])
+@locked
 def delete_area(aid):
     if aid not in app_state.areas:
-        return jsonify({"error": "Area not found"}), 404
-    del app_state.areas[aid]
-    app_state.area_tree.rebuild(app_state.areas)
-    return jsonify({"success": True})
-
-# =====================================================
-# LOAD SHEDDING (BST)
-# =====================================================
-def select_areas_for_cutting(power_needed, hour):
-    if power_needed <= 0:
-        return []
-
-    selected, power_cut = [], 0
-    for aid in app_state.area_tree.inorder():
-        if power_cut >= power_needed:
-            break
-
-        a = app_state.areas[aid]
-        cooldown = {4:2, 3:3, 2:4, 1:0}[a["priority"]]
-
-        if (
-            app_state.area_cut_hours[aid] < max_cut_hours_for_priority(a["priority"]) and
-            hour - app_state.area_last_cut_slot[aid] > cooldown
-        ):
-            selected.append(aid)
-            power_cut += a["load_kw"]
-            app_state.area_cut_hours[aid] += 1
-            app_state.area_last_cut_slot[aid] = hour
-
-    return selected
+        return json_response({"error": "Area not found"}), 404
+    area = app_state.areas.pop(aid)
+    app_state.feeder_areas[area["feeder_id"]].discard(aid)
+    app_state.total_demand -= area["load_kw"]
+    app_state.order_remove(area)
+    app_state.soa_remove(aid)
+    app_state.areas_df = app_state.areas_df[app_state.areas_df["id"] != aid]
+    app_state.graph_version += 1
+    return json_response({"success": True})
 
 # =====================================================
 # SCHEDULE (6 AM → NEXT DAY 6 AM)
 # =====================================================
-@app.route("/api/schedule/generate", methods=["POST"])
-def generate_schedule():
-    energy = request.json.get("available_power",0)
+@locked
+def _do_generate(energy):
+    """Compute a full day's schedule and publish it to app_state.
+    Runs on the scheduler executor, off the request thread."""
     app_state.P_avail_hour = energy / 24 if energy > 0 else 0
 
-    app_state.area_cut_hours = {aid:0 for aid in app_state.areas}
-    app_state.area_last_cut_slot = {aid:-10 for aid in app_state.areas}
-
-    base = datetime.now().replace(hour=6, minute=0, second=0, microsecond=0)
     total_demand = calculate_total_demand()
+    cut_needed = max(0, total_demand - app_state.P_avail_hour)
+
+    # No shortfall (or nothing to shed): every hour stays on, so build
+    # the whole grid in one comprehension and skip the per-hour work.
+    if cut_needed == 0 or not app_state.soa_count:
+        count = app_state.soa_count
+        app_state.soa_cut_hours[:count] = 0
+        app_state.soa_last_cut_slot[:count] = -10
+        schedule = [
+            {
+                "hour": h,
+                "start_time": start_time,
+                "end_time": end_time,
+                "is_cut": False,
+                "areas": []
+            }
+            for h, (start_time, end_time) in enumerate(_HOUR_LABELS)
+        ]
+        app_state.schedule = schedule
+        app_state.schedule_bytes = orjson.dumps({"schedule": schedule})
+        app_state.schedule_version += 1
+        return schedule
+
+    # Gather the persistent struct-of-arrays rows into shed order
+    # (P4 → P1); each hour is then a couple of whole-array expressions
+    # instead of a Python loop with dict lookups per area.
+    order = app_state.ordered_area_ids()
+    n = len(order)
+    area_index = app_state.area_index
+    perm = np.fromiter((area_index[aid] for aid in order), dtype=np.int64, count=n)
+    aids = np.fromiter(order, dtype=np.int64, count=n)
+    loads = app_state.soa_loads[perm]
+    prios = app_state.soa_prios[perm]
+    cut_hours = np.zeros(n, dtype=np.int64)
+    last_cut_slot = np.full(n, -10, dtype=np.int64)
+    rows = np.arange(n)
 
     schedule = []
     for h in range(24):
-        start = base + timedelta(hours=h)
-        end = start + timedelta(hours=1)
-
-        cut_needed = max(0, total_demand - app_state.P_avail_hour)
-        areas_cut = select_areas_for_cutting(cut_needed, h)
+        start_time, end_time = _HOUR_LABELS[h]
+
+        eligible = (
+            (cut_hours < _MAX_CUT_ARR[prios])
+            & (h - last_cut_slot > _COOLDOWN_ARR[prios])
+        )
+        # Prefix of eligible areas whose cumulative load meets the
+        # shortfall: first row where the running sum reaches
+        # cut_needed, found by binary search.
+        csum = np.cumsum(loads * eligible)
+        crossing = np.searchsorted(csum, cut_needed)
+        selected = eligible & (rows <= crossing)
+        cut_hours[selected] += 1
+        last_cut_slot[selected] = h
+        areas_cut = [int(aid) for aid in aids[selected]]
 
         schedule.append({
             "hour": h,
-            "start_time": start.strftime("%H:%M"),
-            "end_time": end.strftime("%H:%M"),
+            "start_time": start_time,
+            "end_time": end_time,
             "is_cut": bool(areas_cut),
             "areas": areas_cut
         })
 
+    # Scatter the fairness counters back to their home rows.
+    app_state.soa_cut_hours[perm] = cut_hours
+    app_state.soa_last_cut_slot[perm] = last_cut_slot
+
     app_state.schedule = schedule
-    return jsonify({"schedule": schedule})
+    app_state.schedule_bytes = orjson.dumps({"schedule": schedule})
+    app_state.schedule_version += 1
+    return schedule
+
+@app.route("/api/schedule/generate", methods=["POST"])
+def generate_schedule():
+    try:
+        payload = msgspec.json.decode(
+            request.get_data() or b"{}", type=GenerateRequest
+        )
+    except msgspec.DecodeError as exc:
+        return json_response({"error": str(exc)}), 400
+    energy = payload.available_power
+
+    with app_state.lock:
+        job_id = app_state.next_job_id
+        app_state.next_job_id += 1
+        app_state.schedule_jobs[job_id] = app_state.scheduler_executor.submit(
+            _do_generate, energy
+        )
+    return json_response({"job_id": job_id}, status=202)
+
+@app.route("/api/schedule/job/<int:job_id>", methods=["GET"])
+def schedule_job(job_id):
+    future = app_state.schedule_jobs.get(job_id)
+    if future is None:
+        return json_response({"error": "Job not found"}), 404
+    if not future.done():
+        return json_response({"status": "pending"})
+    schedule = future.result()
+    # Terminal: the result has been delivered, so drop the Future
+    # rather than accumulating one per generate for the process life.
+    app_state.schedule_jobs.pop(job_id, None)
+    return json_response({"status": "done", "schedule": schedule})
 
 @app.route("/api/schedule", methods=["GET"])
 def get_schedule():
-    return jsonify({"schedule": app_state.schedule})
+    etag = str(app_state.schedule_version)
+    if request.headers.get("If-None-Match") == etag:
+        return "", 304
+    response = Response(app_state.schedule_bytes, mimetype="application/json")
+    response.headers["ETag"] = etag
+    return response
 
 # =====================================================
 # MAINTENANCE (STABLE PRIORITY QUEUE IMPLEMENTATION)
 # =====================================================
+def _task_sort_key(prio, ts_ns):
+    """Pack (priority, arrival) into one int: the monotonic-ns arrival
+    order under the priority in the top bits, so ordering tasks is a
+    single int comparison instead of element-wise tuple compares.
+    Priority fits in 3 bits, leaving 60 bits (~36 years of uptime) for
+    the timestamp — no truncation, so no wraparound mis-ordering."""
+    return (prio << 60) | ts_ns
+
+
+def _maintenance_queue():
+    """Order the live tasks by (area priority, arrival). The priority
+    is read from the area's SoA row at queue-build time — not copied
+    into the task at creation — so re-scored areas never leave stale
+    priorities behind; tasks for deleted areas sink to the bottom.
+    The stored tasks are never mutated here: each response record is a
+    fresh dict with area_priority attached, and the packed sort key
+    stays internal."""
+    area_index = app_state.area_index
+    prios = app_state.soa_prios
+    queue = []
+    for t in app_state.maintenance_map.values():
+        row = area_index.get(t["area_id"])
+        prio = int(prios[row]) if row is not None else 5
+        key = _task_sort_key(prio, t["timestamp"])
+        queue.append((key, {**t, "area_priority": prio}))
+    queue.sort(key=itemgetter(0))
+    return [task for _, task in queue]
+
+
 @app.route("/api/maintenance", methods=["GET", "POST", "OPTIONS"])
+@locked
 def maintenance():
     if request.method == "OPTIONS":
         return "", 200
 
     # ---------- GET ----------
     if request.method == "GET":
-        heap = []
-        tasks = []
-
-        # Build heap from ACTIVE tasks only
-        for task_id, task in app_state.maintenance_map.items():
-            heapq.heappush(
-                heap,
-                (task["area_priority"], task["timestamp"], task_id)
-            )
-
-        while heap:
-            _, _, tid = heapq.heappop(heap)
-            tasks.append(app_state.maintenance_map[tid])
-
-        return jsonify({"queue": tasks})
+        return json_response({"queue": _maintenance_queue()})
 
     # ---------- POST ----------
-    data = request.json
-
     try:
-        area_id = int(data.get("area_id"))
-    except:
-        return jsonify({"error": "Invalid area ID"}), 400
+        data = msgspec.json.decode(request.get_data(), type=NewTask)
+    except msgspec.DecodeError:
+        return json_response({"error": "Invalid area ID"}), 400
 
+    area_id = data.area_id
     if area_id not in app_state.areas:
-        return jsonify({"error": "Invalid area ID"}), 400
+        return json_response({"error": "Invalid area ID"}), 400
 
-    issue = data.get("issue", "").strip()
+    issue = data.issue.strip()
     if not issue:
-        return jsonify({"error": "Issue required"}), 400
+        return json_response({"error": "Issue required"}), 400
 
     area = app_state.areas[area_id]
 
+    # Priority and sort_key are filled in live by _maintenance_queue;
+    # persisting them here is what let them drift out of sync.
     task = {
         "id": app_state.next_task_id,
         "area_id": area_id,
         "area_name": area["name"],
-        "area_priority": area["priority"],
         "issue": issue,
-        "timestamp": datetime.now().isoformat()
+        # int arrival order for queue comparisons; ISO string only for display
+        "timestamp": time.monotonic_ns(),
+        "created_at": datetime.now().isoformat()
     }
 
     app_state.maintenance_map[task["id"]] = task
     app_state.next_task_id += 1
 
-    return jsonify({"success": True, "task": task}), 201
+    return json_response({"success": True, "task": task}), 201
 
 
 @app.route("/api/maintenance/<int:task_id>/resolve", methods=["POST", "OPTIONS"])
+@locked
 def resolve_maintenance(task_id):
     if request.method == "OPTIONS":
         return "", 200
 
     if task_id not in app_state.maintenance_map:
-        return jsonify({"error": "Task not found"}), 404
+        return json_response({"error": "Task not found"}), 404
 
-    # 🔥 REMOVE COMPLETELY
     del app_state.maintenance_map[task_id]
 
-    return jsonify({"success": True})
+    return json_response({"success": True})
 
 
 # =====================================================
 # NETWORK GRAPH & HEALTH
 # =====================================================
+def _graph_payload():
+    return {"feeders": app_state.feeders, "areas": app_state.areas}
+
+
 @app.route("/api/network/graph", methods=["GET"])
 def network_graph():
-    return jsonify({"feeders": app_state.feeders, "areas": app_state.areas})
+    accepts_gzip = "gzip" in request.headers.get("Accept-Encoding", "")
+    # One ETag per encoding, so a shared cache can't hand gzip bytes
+    # to a client that didn't ask for them.
+    etag = f"{app_state.graph_version}-gz" if accepts_gzip else str(app_state.graph_version)
+    if request.headers.get("If-None-Match") == etag:
+        response = Response("", status=304)
+        response.headers["Vary"] = "Accept-Encoding"
+        return response
+
+    # Serialize under the lock: the mutators resize feeders/areas and
+    # iterating them concurrently would blow up mid-dump.
+    with app_state.lock:
+        body = orjson.dumps(_graph_payload(), option=orjson.OPT_NON_STR_KEYS)
+    response = Response(body, mimetype="application/json")
+    # The feeder/area dicts are highly repetitive JSON; gzip cuts the
+    # transfer roughly tenfold for clients that accept it.
+    if accepts_gzip:
+        response.set_data(gzip.compress(body, 5))
+        response.headers["Content-Encoding"] = "gzip"
+    response.headers["ETag"] = etag
+    response.headers["Vary"] = "Accept-Encoding"
+    return response
 
 @app.route("/api/health", methods=["GET"])
 def health():
-    return jsonify({"status": "ok"})
+    return json_response({"status": "ok"})
 
 # =====================================================
 # MAIN
 # =====================================================
 if __name__ == "__main__":
-    print("Backend running on http://localhost:5000")
-    app.run(debug=True, host="0.0.0.0", port=5000)
+    if os.environ.get("FLASK_DEV"):
+        print("Backend running on http://localhost:5000")
+        app.run(debug=True, host="0.0.0.0", port=5000)
+    else:
+        print("Set FLASK_DEV=1 for the dev server; in production run:")
+        print("  gunicorn -w 1 -k gthread --threads 8 -b 0.0.0.0:5000 wsgi:app")
@@ -0,0 +1,11 @@
+"""WSGI entrypoint for production servers.
+
+app_state lives in-process, so run a single worker and scale with
+threads; the handlers take app_state.lock around mutations:
+
+    gunicorn -w 1 -k gthread --threads 8 -b 0.0.0.0:5000 wsgi:app
+"""
+from app2 import app
+
+if __name__ == "__main__":
+    app.run()
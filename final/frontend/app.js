@@ -483,7 +483,20 @@ async function generateSchedule() {
         });
 
         const data = await response.json();
-        state.schedule = data.schedule;
+
+        // Generation runs on a backend worker; poll the job until it
+        // leaves the pending state (done, error, or gone)
+        let result;
+        while (true) {
+            const jobResponse = await fetch(`${API_BASE_URL}/schedule/job/${data.job_id}`);
+            result = await jobResponse.json();
+            if (result.status !== 'pending') break;
+            await new Promise(resolve => setTimeout(resolve, 200));
+        }
+        if (result.status !== 'done') {
+            throw new Error(result.error || 'Schedule job failed');
+        }
+        state.schedule = result.schedule;
 
         displaySchedule();
         showNotification('Schedule generated successfully!', 'success');
@@ -738,7 +751,7 @@ async function loadMaintenance() {
                                 <span class="priority-badge" style="background-color: ${priorityColor};">${priorityLabel}</span>
                             </div>
                             <p class="maintenance-issue">${task.issue}</p>
-                            <p class="maintenance-time">${new Date(task.timestamp).toLocaleString()}</p>
+                            <p class="maintenance-time">${new Date(task.created_at).toLocaleString()}</p>
                         </div>
                         <div class="maintenance-actions">
                             <label class="checkbox-container">